@@ -115,6 +115,59 @@ impl EnterpriseClientBuilder {
     }
 }
 
+/// Connection settings read from environment variables
+///
+/// Used by [`EnterpriseClient::from_env`]. Exposed separately so callers can
+/// inspect or compare the settings (e.g. to reuse a client while they are
+/// unchanged) before building a client.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct EnvConfig {
+    pub base_url: String,
+    pub username: String,
+    pub password: String,
+    pub insecure: bool,
+}
+
+impl EnvConfig {
+    /// Read the settings from the environment
+    ///
+    /// Reads configuration from:
+    /// - `REDIS_ENTERPRISE_URL`: Base URL for the cluster (default: "https://localhost:9443")
+    /// - `REDIS_ENTERPRISE_USER`: Username for authentication (default: "admin@redis.local")
+    /// - `REDIS_ENTERPRISE_PASSWORD`: Password for authentication (required)
+    /// - `REDIS_ENTERPRISE_INSECURE`: Set to "true" to skip SSL verification (default: "false")
+    pub fn from_env() -> Result<Self> {
+        use std::env;
+
+        let base_url = env::var("REDIS_ENTERPRISE_URL")
+            .unwrap_or_else(|_| "https://localhost:9443".to_string());
+        let username =
+            env::var("REDIS_ENTERPRISE_USER").unwrap_or_else(|_| "admin@redis.local".to_string());
+        let password =
+            env::var("REDIS_ENTERPRISE_PASSWORD").map_err(|_| RestError::AuthenticationFailed)?;
+        let insecure = env::var("REDIS_ENTERPRISE_INSECURE")
+            .unwrap_or_else(|_| "false".to_string())
+            .parse::<bool>()
+            .unwrap_or(false);
+
+        Ok(Self {
+            base_url,
+            username,
+            password,
+            insecure,
+        })
+    }
+
+    /// Create a client builder with these settings
+    pub fn builder(&self) -> EnterpriseClientBuilder {
+        EnterpriseClient::builder()
+            .base_url(self.base_url.as_str())
+            .username(self.username.as_str())
+            .password(self.password.as_str())
+            .insecure(self.insecure)
+    }
+}
+
 /// REST API client for Redis Enterprise
 #[derive(Clone)]
 pub struct EnterpriseClient {
@@ -148,31 +201,9 @@ impl EnterpriseClient {
 
     /// Create a client from environment variables
     ///
-    /// Reads configuration from:
-    /// - `REDIS_ENTERPRISE_URL`: Base URL for the cluster (default: "https://localhost:9443")
-    /// - `REDIS_ENTERPRISE_USER`: Username for authentication (default: "admin@redis.local")
-    /// - `REDIS_ENTERPRISE_PASSWORD`: Password for authentication (required)
-    /// - `REDIS_ENTERPRISE_INSECURE`: Set to "true" to skip SSL verification (default: "false")
+    /// See [`EnvConfig::from_env`] for the variables read.
     pub fn from_env() -> Result<Self> {
-        use std::env;
-
-        let base_url = env::var("REDIS_ENTERPRISE_URL")
-            .unwrap_or_else(|_| "https://localhost:9443".to_string());
-        let username =
-            env::var("REDIS_ENTERPRISE_USER").unwrap_or_else(|_| "admin@redis.local".to_string());
-        let password =
-            env::var("REDIS_ENTERPRISE_PASSWORD").map_err(|_| RestError::AuthenticationFailed)?;
-        let insecure = env::var("REDIS_ENTERPRISE_INSECURE")
-            .unwrap_or_else(|_| "false".to_string())
-            .parse::<bool>()
-            .unwrap_or(false);
-
-        Self::builder()
-            .base_url(base_url)
-            .username(username)
-            .password(password)
-            .insecure(insecure)
-            .build()
+        EnvConfig::from_env()?.builder().build()
     }
 
     /// Make a GET request
@@ -364,7 +364,7 @@ pub mod users;
 mod lib_tests;
 
 // Core client and error types
-pub use client::{EnterpriseClient, EnterpriseClientBuilder};
+pub use client::{EnterpriseClient, EnterpriseClientBuilder, EnvConfig};
 pub use error::{RestError, Result};
 
 // Re-export Tower integration when feature is enabled
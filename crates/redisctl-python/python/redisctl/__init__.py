@@ -17,19 +17,48 @@ Example:
     ...     password="secret"
     ... )
     >>> dbs = enterprise.databases_sync()
+    >>>
+    >>> # Raw response bytes, skipping conversion to Python objects
+    >>> body = enterprise.get_sync("/v1/bdbs", raw=True)
 """
 
-# Import from the native Rust extension
-from redisctl.redisctl import (
-    CloudClient,
-    EnterpriseClient,
-    RedisCtlError,
-    __version__,
-)
+import importlib as _importlib
+from types import ModuleType as _ModuleType
+from typing import Any as _Any
 
-__all__ = [
+__all__ = (
     "CloudClient",
     "EnterpriseClient",
     "RedisCtlError",
     "__version__",
-]
+)
+
+# Names resolved from the native extension on first access (PEP 562), so
+# that `import redisctl` does not load the Rust library until it is needed.
+_NATIVE_NAMES = frozenset(__all__) | {"_reset_env_cache"}
+
+
+def _load() -> _ModuleType:
+    """Import the native extension through the regular import system.
+
+    The import system serializes concurrent first imports and binds the
+    submodule as the package's `redisctl` attribute.
+    """
+    return _importlib.import_module(f"{__name__}.redisctl")
+
+
+def __getattr__(name: str) -> _Any:
+    if name == "redisctl":
+        return _load()
+    if name in _NATIVE_NAMES:
+        _native = _load()
+
+        g = globals()
+        for native_name in _NATIVE_NAMES:
+            g[native_name] = getattr(_native, native_name)
+        return g[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _NATIVE_NAMES | {"redisctl"})
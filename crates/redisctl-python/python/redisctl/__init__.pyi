@@ -1,9 +1,13 @@
 """Type stubs for redisctl Python bindings."""
 
-from typing import Any, Awaitable, Optional
+from typing import Any, Awaitable, Literal, Optional, overload
 
 __version__: str
 
+def _reset_env_cache() -> None:
+    """Drop the clients cached by ``from_env``."""
+    ...
+
 class RedisCtlError(Exception):
     """Base exception for redisctl errors."""
 
@@ -52,6 +56,9 @@ class CloudClient:
             - API Key: REDIS_CLOUD_API_KEY, REDIS_CLOUD_ACCOUNT_KEY
             - API Secret: REDIS_CLOUD_API_SECRET, REDIS_CLOUD_SECRET_KEY, REDIS_CLOUD_USER_KEY
             - Base URL: REDIS_CLOUD_BASE_URL, REDIS_CLOUD_API_URL (optional)
+
+        Clients created while these variables are unchanged share one
+        underlying HTTP client; changing them builds a new one.
         """
         ...
 
@@ -108,12 +115,40 @@ class CloudClient:
         ...
 
     # Raw API
-    def get(self, path: str) -> Awaitable[dict[str, Any]]:
-        """Execute a raw GET request (async)."""
+    @overload
+    def get(
+        self, path: str, *, raw: Literal[False] = False
+    ) -> Awaitable[dict[str, Any]]: ...
+    @overload
+    def get(self, path: str, *, raw: Literal[True]) -> Awaitable[bytes]: ...
+    def get(self, path: str, *, raw: bool = False) -> Awaitable[Any]:
+        """Execute a raw GET request (async).
+
+        With ``raw=True`` the unparsed response body is returned as bytes.
+        """
         ...
 
-    def get_sync(self, path: str) -> dict[str, Any]:
-        """Execute a raw GET request (sync)."""
+    @overload
+    def get_sync(self, path: str, *, raw: Literal[False] = False) -> dict[str, Any]: ...
+    @overload
+    def get_sync(self, path: str, *, raw: Literal[True]) -> bytes: ...
+    def get_sync(self, path: str, *, raw: bool = False) -> Any:
+        """Execute a raw GET request (sync).
+
+        With ``raw=True`` the unparsed response body is returned as bytes.
+        """
+        ...
+
+    def get_many(self, paths: list[str]) -> Awaitable[list[Any]]:
+        """Execute multiple raw GET requests concurrently (async)."""
+        ...
+
+    def get_many_sync(self, paths: list[str]) -> list[Any]:
+        """Execute multiple raw GET requests concurrently (sync).
+
+        Every path is requested at once with no concurrency limit, so very
+        large lists can hit API rate limits (HTTP 429).
+        """
         ...
 
     def post(self, path: str, body: dict[str, Any]) -> Awaitable[dict[str, Any]]:
@@ -191,6 +226,9 @@ class EnterpriseClient:
             - REDIS_ENTERPRISE_USER
             - REDIS_ENTERPRISE_PASSWORD
             - REDIS_ENTERPRISE_INSECURE
+
+        Clients created while these variables are unchanged share one
+        underlying HTTP client; changing them builds a new one.
         """
         ...
 
@@ -211,6 +249,14 @@ class EnterpriseClient:
         """Get cluster statistics (sync)."""
         ...
 
+    def cluster_stats_ndarray(self) -> Awaitable[dict[str, Any]]:
+        """Get cluster statistics as NumPy arrays, one per metric (async)."""
+        ...
+
+    def cluster_stats_ndarray_sync(self) -> dict[str, Any]:
+        """Get cluster statistics as NumPy arrays, one per metric (sync)."""
+        ...
+
     def license(self) -> Awaitable[dict[str, Any]]:
         """Get license information (async)."""
         ...
@@ -244,6 +290,14 @@ class EnterpriseClient:
         """Get database statistics (sync)."""
         ...
 
+    def database_stats_ndarray(self, uid: int) -> Awaitable[dict[str, Any]]:
+        """Get database statistics as NumPy arrays, one per metric (async)."""
+        ...
+
+    def database_stats_ndarray_sync(self, uid: int) -> dict[str, Any]:
+        """Get database statistics as NumPy arrays, one per metric (sync)."""
+        ...
+
     # Nodes
     def nodes(self) -> Awaitable[list[dict[str, Any]]]:
         """List all nodes (async)."""
@@ -269,6 +323,14 @@ class EnterpriseClient:
         """Get node statistics (sync)."""
         ...
 
+    def node_stats_ndarray(self, uid: int) -> Awaitable[dict[str, Any]]:
+        """Get node statistics as NumPy arrays, one per metric (async)."""
+        ...
+
+    def node_stats_ndarray_sync(self, uid: int) -> dict[str, Any]:
+        """Get node statistics as NumPy arrays, one per metric (sync)."""
+        ...
+
     # Users
     def users(self) -> Awaitable[list[dict[str, Any]]]:
         """List all users (async)."""
@@ -287,12 +349,40 @@ class EnterpriseClient:
         ...
 
     # Raw API
-    def get(self, path: str) -> Awaitable[dict[str, Any]]:
-        """Execute a raw GET request (async)."""
+    @overload
+    def get(
+        self, path: str, *, raw: Literal[False] = False
+    ) -> Awaitable[dict[str, Any]]: ...
+    @overload
+    def get(self, path: str, *, raw: Literal[True]) -> Awaitable[bytes]: ...
+    def get(self, path: str, *, raw: bool = False) -> Awaitable[Any]:
+        """Execute a raw GET request (async).
+
+        With ``raw=True`` the unparsed response body is returned as bytes.
+        """
         ...
 
-    def get_sync(self, path: str) -> dict[str, Any]:
-        """Execute a raw GET request (sync)."""
+    @overload
+    def get_sync(self, path: str, *, raw: Literal[False] = False) -> dict[str, Any]: ...
+    @overload
+    def get_sync(self, path: str, *, raw: Literal[True]) -> bytes: ...
+    def get_sync(self, path: str, *, raw: bool = False) -> Any:
+        """Execute a raw GET request (sync).
+
+        With ``raw=True`` the unparsed response body is returned as bytes.
+        """
+        ...
+
+    def get_many(self, paths: list[str]) -> Awaitable[list[Any]]:
+        """Execute multiple raw GET requests concurrently (async)."""
+        ...
+
+    def get_many_sync(self, paths: list[str]) -> list[Any]:
+        """Execute multiple raw GET requests concurrently (sync).
+
+        Every path is requested at once with no concurrency limit, so very
+        large lists can hit API rate limits (HTTP 429).
+        """
         ...
 
     def post(self, path: str, body: dict[str, Any]) -> Awaitable[dict[str, Any]]:
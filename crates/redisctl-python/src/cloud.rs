@@ -2,10 +2,12 @@
 //!
 //! Provides both async and sync APIs for managing Redis Cloud resources.
 
+use crate::env;
 use crate::error::IntoPyResult;
 use crate::runtime::{block_on, future_into_py};
+use futures::future::try_join_all;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyBytes, PyDict, PyList};
 use redis_cloud::{CloudClient, DatabaseHandler, SubscriptionHandler};
 use std::sync::Arc;
 use std::time::Duration;
@@ -32,7 +34,7 @@ use std::time::Duration;
 /// # Sync usage
 /// subs = client.subscriptions_sync()
 /// ```
-#[pyclass(name = "CloudClient")]
+#[pyclass(frozen, name = "CloudClient", module = "redisctl.redisctl")]
 pub struct PyCloudClient {
     client: Arc<CloudClient>,
 }
@@ -88,43 +90,15 @@ impl PyCloudClient {
     /// Returns:
     ///     CloudClient instance
     ///
+    /// Clients created while these variables are unchanged share one
+    /// underlying HTTP client; changing them builds a new one.
+    ///
     /// Raises:
     ///     ValueError: If required environment variables are missing
     #[staticmethod]
     fn from_env() -> PyResult<Self> {
-        // Try multiple env var names for API key (account key)
-        let api_key = std::env::var("REDIS_CLOUD_API_KEY")
-            .or_else(|_| std::env::var("REDIS_CLOUD_ACCOUNT_KEY"))
-            .map_err(|_| {
-                pyo3::exceptions::PyValueError::new_err(
-                    "API key not found. Set REDIS_CLOUD_API_KEY or REDIS_CLOUD_ACCOUNT_KEY",
-                )
-            })?;
-
-        // Try multiple env var names for API secret (user key)
-        let api_secret = std::env::var("REDIS_CLOUD_API_SECRET")
-            .or_else(|_| std::env::var("REDIS_CLOUD_SECRET_KEY"))
-            .or_else(|_| std::env::var("REDIS_CLOUD_USER_KEY"))
-            .map_err(|_| {
-                pyo3::exceptions::PyValueError::new_err(
-                    "API secret not found. Set REDIS_CLOUD_API_SECRET, REDIS_CLOUD_SECRET_KEY, or REDIS_CLOUD_USER_KEY",
-                )
-            })?;
-
-        let mut builder = CloudClient::builder()
-            .api_key(api_key)
-            .api_secret(api_secret);
-
-        // Try multiple env var names for base URL
-        if let Ok(base_url) =
-            std::env::var("REDIS_CLOUD_BASE_URL").or_else(|_| std::env::var("REDIS_CLOUD_API_URL"))
-        {
-            builder = builder.base_url(base_url);
-        }
-
-        let client = builder.build().into_py_result()?;
         Ok(Self {
-            client: Arc::new(client),
+            client: env::cloud_client()?,
         })
     }
 
@@ -153,12 +127,12 @@ impl PyCloudClient {
     ///     List of subscription dictionaries
     fn subscriptions_sync(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = SubscriptionHandler::new((*client).clone());
-            handler.get_all_subscriptions().await.into_py_result()
+            let result = handler.get_all_subscriptions().await.into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -190,15 +164,15 @@ impl PyCloudClient {
     /// Get a specific subscription by ID (sync/blocking)
     fn subscription_sync(&self, py: Python<'_>, subscription_id: i64) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = SubscriptionHandler::new((*client).clone());
-            handler
+            let result = handler
                 .get_subscription_by_id(subscription_id as i32)
                 .await
-                .into_py_result()
+                .into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -246,15 +220,15 @@ impl PyCloudClient {
         limit: Option<i32>,
     ) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = DatabaseHandler::new((*client).clone());
-            handler
+            let result = handler
                 .get_subscription_databases(subscription_id as i32, offset, limit)
                 .await
-                .into_py_result()
+                .into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -293,15 +267,15 @@ impl PyCloudClient {
         database_id: i64,
     ) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = DatabaseHandler::new((*client).clone());
-            handler
+            let result = handler
                 .get_subscription_database_by_id(subscription_id as i32, database_id as i32)
                 .await
-                .into_py_result()
+                .into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -313,27 +287,74 @@ impl PyCloudClient {
     ///
     /// Args:
     ///     path: API path (e.g., "/subscriptions")
+    ///     raw: Return the unparsed response body as bytes (default: False)
     ///
     /// Returns:
-    ///     Response as dictionary
-    fn get<'py>(&self, py: Python<'py>, path: String) -> PyResult<Bound<'py, PyAny>> {
+    ///     Response as dictionary, or bytes if `raw` is True
+    #[pyo3(signature = (path, *, raw=false))]
+    fn get<'py>(&self, py: Python<'py>, path: String, raw: bool) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
         future_into_py(py, async move {
-            let result = client.get_raw(&path).await.into_py_result()?;
+            if raw {
+                let bytes = client.get_bytes(&path).await.into_py_result()?;
+                return Python::attach(|py| Ok(PyBytes::new(py, &bytes).into_any().unbind()));
+            }
+            let result = get_json(&client, &path).await?;
             Python::attach(|py| Ok(json_to_py(py, result)))
         })
     }
 
     /// Execute a raw GET request (sync/blocking)
-    fn get_sync(&self, py: Python<'_>, path: String) -> PyResult<Py<PyAny>> {
+    ///
+    /// With `raw=True` the response body is returned as bytes without being
+    /// parsed, e.g. for passing straight to `orjson.loads` or writing to disk.
+    #[pyo3(signature = (path, *, raw=false))]
+    fn get_sync(&self, py: Python<'_>, path: String, raw: bool) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(
-            py,
-            async move { client.get_raw(&path).await.into_py_result() },
-        )?;
+        if raw {
+            let bytes = block_on(
+                py,
+                async move { client.get_bytes(&path).await.into_py_result() },
+            )?;
+            return Ok(PyBytes::new(py, &bytes).into_any().unbind());
+        }
+        let result = block_on(py, async move { get_json(&client, &path).await })?;
         Ok(json_to_py(py, result))
     }
 
+    /// Execute multiple raw GET requests concurrently (async)
+    ///
+    /// Args:
+    ///     paths: API paths (e.g., ["/subscriptions/1", "/subscriptions/2"])
+    ///
+    /// Returns:
+    ///     List of responses, in the same order as `paths`
+    ///
+    /// All paths are requested at once with no concurrency limit; split
+    /// large lists into smaller batches to avoid Cloud API rate limiting
+    /// (HTTP 429).
+    fn get_many<'py>(&self, py: Python<'py>, paths: Vec<String>) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let results = try_join_all(paths.iter().map(|path| get_json(&client, path))).await?;
+            Python::attach(|py| json_list_to_py(py, results))
+        })
+    }
+
+    /// Execute multiple raw GET requests concurrently (sync/blocking)
+    ///
+    /// All requests are sent in a single call, so the GIL is released once
+    /// for the whole batch rather than once per path. As with `get_many`,
+    /// every path is requested at once; large lists can trigger Cloud API
+    /// rate limiting (HTTP 429).
+    fn get_many_sync(&self, py: Python<'_>, paths: Vec<String>) -> PyResult<Py<PyAny>> {
+        let client = self.client.clone();
+        let results = block_on(py, async move {
+            try_join_all(paths.iter().map(|path| get_json(&client, path))).await
+        })?;
+        json_list_to_py(py, results)
+    }
+
     /// Execute a raw POST request (async)
     ///
     /// Args:
@@ -414,6 +435,30 @@ impl PyCloudClient {
 // Helper functions for JSON <-> Python conversion
 // -----------------------------------------------------------------------------
 
+/// Execute a GET request and parse the response body with simd-json
+///
+/// Used by the raw GET methods instead of `CloudClient::get_raw`, which
+/// parses with serde_json. `get_bytes` reports HTTP errors the same way, and
+/// malformed bodies raise `ConnectionError` as `get_raw` does.
+async fn get_json(client: &CloudClient, path: &str) -> PyResult<serde_json::Value> {
+    let bytes = client.get_bytes(path).await.into_py_result()?;
+    parse_json(bytes)
+        .map_err(|e| {
+            redis_cloud::CloudError::ConnectionError(format!(
+                "Failed to deserialize response: {}",
+                e
+            ))
+        })
+        .into_py_result()
+}
+
+/// Parse a JSON response body with simd-json
+///
+/// simd-json parses in place, so this takes ownership of the buffer.
+pub fn parse_json(mut bytes: Vec<u8>) -> Result<serde_json::Value, simd_json::Error> {
+    simd_json::serde::from_slice(&mut bytes)
+}
+
 /// Convert a serde_json::Value to a Python object
 pub fn json_to_py(py: Python<'_>, value: serde_json::Value) -> Py<PyAny> {
     match value {
@@ -443,6 +488,12 @@ pub fn json_to_py(py: Python<'_>, value: serde_json::Value) -> Py<PyAny> {
     }
 }
 
+/// Convert a list of serde_json::Values to a Python list
+pub fn json_list_to_py(py: Python<'_>, values: Vec<serde_json::Value>) -> PyResult<Py<PyAny>> {
+    let list = PyList::new(py, values.into_iter().map(|v| json_to_py(py, v)))?;
+    Ok(list.into_any().unbind())
+}
+
 /// Convert a Python object to serde_json::Value
 pub fn py_to_json(py: Python<'_>, obj: Py<PyAny>) -> PyResult<serde_json::Value> {
     let obj = obj.bind(py);
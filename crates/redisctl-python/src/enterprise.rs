@@ -2,11 +2,17 @@
 //!
 //! Provides both async and sync APIs for managing Redis Enterprise clusters.
 
-use crate::cloud::{json_to_py, py_to_json};
+use crate::cloud::{json_list_to_py, json_to_py, parse_json, py_to_json};
+use crate::env;
 use crate::error::IntoPyResult;
 use crate::runtime::{block_on, future_into_py};
+use crate::stats::StatsColumns;
+use futures::future::try_join_all;
 use pyo3::prelude::*;
-use redis_enterprise::{BdbHandler, ClusterHandler, EnterpriseClient, NodeHandler, UserHandler};
+use pyo3::types::PyBytes;
+use redis_enterprise::{
+    BdbHandler, ClusterHandler, EnterpriseClient, NodeHandler, RestError, UserHandler,
+};
 use std::sync::Arc;
 use std::time::Duration;
 
@@ -37,7 +43,7 @@ use std::time::Duration;
 /// # Sync usage
 /// dbs = client.databases_sync()
 /// ```
-#[pyclass(name = "EnterpriseClient")]
+#[pyclass(frozen, name = "EnterpriseClient", module = "redisctl.redisctl")]
 pub struct PyEnterpriseClient {
     client: Arc<EnterpriseClient>,
 }
@@ -91,13 +97,15 @@ impl PyEnterpriseClient {
     /// - REDIS_ENTERPRISE_PASSWORD: Password (required)
     /// - REDIS_ENTERPRISE_INSECURE: Set to "true" to skip SSL verification
     ///
+    /// Clients created while these variables are unchanged share one
+    /// underlying HTTP client; changing them builds a new one.
+    ///
     /// Returns:
     ///     EnterpriseClient instance
     #[staticmethod]
     fn from_env() -> PyResult<Self> {
-        let client = EnterpriseClient::from_env().into_py_result()?;
         Ok(Self {
-            client: Arc::new(client),
+            client: env::enterprise_client()?,
         })
     }
 
@@ -123,12 +131,12 @@ impl PyEnterpriseClient {
     /// Get cluster information (sync/blocking)
     fn cluster_info_sync(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = ClusterHandler::new((*client).clone());
-            handler.info().await.into_py_result()
+            let result = handler.info().await.into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -152,6 +160,35 @@ impl PyEnterpriseClient {
         Ok(json_to_py(py, result))
     }
 
+    /// Get cluster statistics as NumPy arrays (async)
+    ///
+    /// Returns:
+    ///     Dictionary of metric name to `numpy.ndarray` (float64, one sample
+    ///     per interval); `stime`, `etime` and `interval` are lists of strings
+    ///
+    /// Raises:
+    ///     ImportError: If NumPy is not installed
+    fn cluster_stats_ndarray<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let handler = ClusterHandler::new((*client).clone());
+            let stats = handler.stats().await.into_py_result()?;
+            let columns = StatsColumns::from_value(&stats);
+            Python::attach(|py| columns.into_py(py))
+        })
+    }
+
+    /// Get cluster statistics as NumPy arrays (sync/blocking)
+    fn cluster_stats_ndarray_sync(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let client = self.client.clone();
+        let columns = block_on(py, async move {
+            let handler = ClusterHandler::new((*client).clone());
+            let stats = handler.stats().await.into_py_result()?;
+            Ok::<_, PyErr>(StatsColumns::from_value(&stats))
+        })?;
+        columns.into_py(py)
+    }
+
     /// Get license information (async)
     fn license<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
@@ -167,12 +204,12 @@ impl PyEnterpriseClient {
     /// Get license information (sync/blocking)
     fn license_sync(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = ClusterHandler::new((*client).clone());
-            handler.license().await.into_py_result()
+            let result = handler.license().await.into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -198,12 +235,12 @@ impl PyEnterpriseClient {
     /// List all databases (sync/blocking)
     fn databases_sync(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = BdbHandler::new((*client).clone());
-            handler.list().await.into_py_result()
+            let result = handler.list().await.into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -228,12 +265,12 @@ impl PyEnterpriseClient {
     /// Get a specific database by ID (sync/blocking)
     fn database_sync(&self, py: Python<'_>, uid: u32) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = BdbHandler::new((*client).clone());
-            handler.get(uid).await.into_py_result()
+            let result = handler.get(uid).await.into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -258,6 +295,39 @@ impl PyEnterpriseClient {
         Ok(json_to_py(py, result))
     }
 
+    /// Get database statistics as NumPy arrays (async)
+    ///
+    /// Returns:
+    ///     Dictionary of metric name to `numpy.ndarray` (float64, one sample
+    ///     per interval); `stime`, `etime` and `interval` are lists of strings
+    ///
+    /// Raises:
+    ///     ImportError: If NumPy is not installed
+    fn database_stats_ndarray<'py>(
+        &self,
+        py: Python<'py>,
+        uid: u32,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let handler = BdbHandler::new((*client).clone());
+            let stats = handler.stats(uid).await.into_py_result()?;
+            let columns = StatsColumns::from_value(&stats);
+            Python::attach(|py| columns.into_py(py))
+        })
+    }
+
+    /// Get database statistics as NumPy arrays (sync/blocking)
+    fn database_stats_ndarray_sync(&self, py: Python<'_>, uid: u32) -> PyResult<Py<PyAny>> {
+        let client = self.client.clone();
+        let columns = block_on(py, async move {
+            let handler = BdbHandler::new((*client).clone());
+            let stats = handler.stats(uid).await.into_py_result()?;
+            Ok::<_, PyErr>(StatsColumns::from_value(&stats))
+        })?;
+        columns.into_py(py)
+    }
+
     // -------------------------------------------------------------------------
     // Nodes API
     // -------------------------------------------------------------------------
@@ -280,12 +350,12 @@ impl PyEnterpriseClient {
     /// List all nodes (sync/blocking)
     fn nodes_sync(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = NodeHandler::new((*client).clone());
-            handler.list().await.into_py_result()
+            let result = handler.list().await.into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -304,12 +374,12 @@ impl PyEnterpriseClient {
     /// Get a specific node by ID (sync/blocking)
     fn node_sync(&self, py: Python<'_>, uid: u32) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = NodeHandler::new((*client).clone());
-            handler.get(uid).await.into_py_result()
+            let result = handler.get(uid).await.into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -328,15 +398,48 @@ impl PyEnterpriseClient {
     /// Get node statistics (sync/blocking)
     fn node_stats_sync(&self, py: Python<'_>, uid: u32) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = NodeHandler::new((*client).clone());
-            handler.stats(uid).await.into_py_result()
+            let result = handler.stats(uid).await.into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
+    /// Get node statistics as NumPy arrays (async)
+    ///
+    /// Returns:
+    ///     Dictionary of metric name to `numpy.ndarray` (float64, one sample
+    ///     per interval); `stime`, `etime` and `interval` are lists of strings
+    ///
+    /// Raises:
+    ///     ImportError: If NumPy is not installed
+    fn node_stats_ndarray<'py>(&self, py: Python<'py>, uid: u32) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let handler = NodeHandler::new((*client).clone());
+            let stats = handler.stats(uid).await.into_py_result()?;
+            let stats = serde_json::to_value(&stats)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+            let columns = StatsColumns::from_value(&stats);
+            Python::attach(|py| columns.into_py(py))
+        })
+    }
+
+    /// Get node statistics as NumPy arrays (sync/blocking)
+    fn node_stats_ndarray_sync(&self, py: Python<'_>, uid: u32) -> PyResult<Py<PyAny>> {
+        let client = self.client.clone();
+        let columns = block_on(py, async move {
+            let handler = NodeHandler::new((*client).clone());
+            let stats = handler.stats(uid).await.into_py_result()?;
+            let stats = serde_json::to_value(&stats)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+            Ok::<_, PyErr>(StatsColumns::from_value(&stats))
+        })?;
+        columns.into_py(py)
+    }
+
     // -------------------------------------------------------------------------
     // Users API
     // -------------------------------------------------------------------------
@@ -359,12 +462,12 @@ impl PyEnterpriseClient {
     /// List all users (sync/blocking)
     fn users_sync(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = UserHandler::new((*client).clone());
-            handler.list().await.into_py_result()
+            let result = handler.list().await.into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -383,12 +486,12 @@ impl PyEnterpriseClient {
     /// Get a specific user by ID (sync/blocking)
     fn user_sync(&self, py: Python<'_>, uid: u32) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(py, async move {
+        let json = block_on(py, async move {
             let handler = UserHandler::new((*client).clone());
-            handler.get(uid).await.into_py_result()
+            let result = handler.get(uid).await.into_py_result()?;
+            serde_json::to_value(&result)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
         })?;
-        let json = serde_json::to_value(&result)
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
         Ok(json_to_py(py, json))
     }
 
@@ -400,27 +503,71 @@ impl PyEnterpriseClient {
     ///
     /// Args:
     ///     path: API path (e.g., "/v1/cluster")
+    ///     raw: Return the unparsed response body as bytes (default: False)
     ///
     /// Returns:
-    ///     Response as dictionary
-    fn get<'py>(&self, py: Python<'py>, path: String) -> PyResult<Bound<'py, PyAny>> {
+    ///     Response as dictionary, or bytes if `raw` is True
+    #[pyo3(signature = (path, *, raw=false))]
+    fn get<'py>(&self, py: Python<'py>, path: String, raw: bool) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
         future_into_py(py, async move {
-            let result = client.get_raw(&path).await.into_py_result()?;
+            if raw {
+                let bytes = get_bytes(&client, &path).await?;
+                return Python::attach(|py| Ok(PyBytes::new(py, &bytes).into_any().unbind()));
+            }
+            let result = get_json(&client, &path).await?;
             Python::attach(|py| Ok(json_to_py(py, result)))
         })
     }
 
     /// Execute a raw GET request (sync/blocking)
-    fn get_sync(&self, py: Python<'_>, path: String) -> PyResult<Py<PyAny>> {
+    ///
+    /// With `raw=True` the response body is returned as bytes without being
+    /// parsed, e.g. for passing straight to `orjson.loads` or writing to disk.
+    #[pyo3(signature = (path, *, raw=false))]
+    fn get_sync(&self, py: Python<'_>, path: String, raw: bool) -> PyResult<Py<PyAny>> {
         let client = self.client.clone();
-        let result = block_on(
-            py,
-            async move { client.get_raw(&path).await.into_py_result() },
-        )?;
+        if raw {
+            let bytes = block_on(py, async move { get_bytes(&client, &path).await })?;
+            return Ok(PyBytes::new(py, &bytes).into_any().unbind());
+        }
+        let result = block_on(py, async move { get_json(&client, &path).await })?;
         Ok(json_to_py(py, result))
     }
 
+    /// Execute multiple raw GET requests concurrently (async)
+    ///
+    /// Args:
+    ///     paths: API paths (e.g., ["/v1/bdbs/1", "/v1/bdbs/2"])
+    ///
+    /// Returns:
+    ///     List of responses, in the same order as `paths`
+    ///
+    /// All paths are requested at once with no concurrency limit; split
+    /// large lists into smaller batches to avoid Enterprise API rate limiting
+    /// (HTTP 429).
+    fn get_many<'py>(&self, py: Python<'py>, paths: Vec<String>) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let results = try_join_all(paths.iter().map(|path| get_json(&client, path))).await?;
+            Python::attach(|py| json_list_to_py(py, results))
+        })
+    }
+
+    /// Execute multiple raw GET requests concurrently (sync/blocking)
+    ///
+    /// All requests are sent in a single call, so the GIL is released once
+    /// for the whole batch rather than once per path. As with `get_many`,
+    /// every path is requested at once; large lists can trigger Enterprise API
+    /// rate limiting (HTTP 429).
+    fn get_many_sync(&self, py: Python<'_>, paths: Vec<String>) -> PyResult<Py<PyAny>> {
+        let client = self.client.clone();
+        let results = block_on(py, async move {
+            try_join_all(paths.iter().map(|path| get_json(&client, path))).await
+        })?;
+        json_list_to_py(py, results)
+    }
+
     /// Execute a raw POST request (async)
     fn post<'py>(
         &self,
@@ -489,3 +636,79 @@ impl PyEnterpriseClient {
         Ok(json_to_py(py, result))
     }
 }
+
+/// Execute a GET request returning the raw response body
+///
+/// Used for `raw=True`. HTTP errors are reported the same way as by the
+/// JSON methods, so both raise the same Python exceptions.
+async fn get_bytes(client: &EnterpriseClient, path: &str) -> PyResult<Vec<u8>> {
+    client
+        .get_binary(path)
+        .await
+        .map_err(status_error)
+        .into_py_result()
+}
+
+/// Execute a GET request and parse the response body with simd-json
+///
+/// Used by the raw GET methods instead of `EnterpriseClient::get_raw`, which
+/// parses with serde_json. Errors are reported as `get_raw` reports them.
+async fn get_json(client: &EnterpriseClient, path: &str) -> PyResult<serde_json::Value> {
+    let bytes = get_bytes(client, path).await?;
+    parse_json(bytes)
+        .map_err(|e| RestError::ParseError(format!("Failed to deserialize response: {}", e)))
+        .into_py_result()
+}
+
+/// Map a generic `ApiError` to the variant `get_raw` would report
+///
+/// `EnterpriseClient::get_binary` reports every non-2xx status as `ApiError`,
+/// while the JSON path distinguishes 401, 404 and 5xx.
+fn status_error(err: RestError) -> RestError {
+    match err {
+        RestError::ApiError { code: 401, .. } => RestError::Unauthorized,
+        RestError::ApiError { code: 404, .. } => RestError::NotFound,
+        RestError::ApiError {
+            code: 500..=599,
+            message,
+        } => RestError::ServerError(message),
+        other => other,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn api_error(code: u16) -> RestError {
+        RestError::ApiError {
+            code,
+            message: "body".to_string(),
+        }
+    }
+
+    #[test]
+    fn test_status_error_maps_known_statuses() {
+        assert!(matches!(
+            status_error(api_error(401)),
+            RestError::Unauthorized
+        ));
+        assert!(matches!(status_error(api_error(404)), RestError::NotFound));
+        assert!(matches!(
+            status_error(api_error(503)),
+            RestError::ServerError(message) if message == "body"
+        ));
+    }
+
+    #[test]
+    fn test_status_error_keeps_other_errors() {
+        assert!(matches!(
+            status_error(api_error(409)),
+            RestError::ApiError { code: 409, .. }
+        ));
+        assert!(matches!(
+            status_error(RestError::AuthenticationFailed),
+            RestError::AuthenticationFailed
+        ));
+    }
+}
@@ -0,0 +1,125 @@
+//! Cached clients for `from_env` constructors
+//!
+//! `CloudClient.from_env()` and `EnterpriseClient.from_env()` read their
+//! settings from the environment on every call, but reuse the previously
+//! built Rust client (and its HTTP connection pool) as long as those settings
+//! are unchanged. Any change to the environment variables builds a new
+//! client. Failed lookups are not cached. `_reset_env_cache()` drops the
+//! cached clients.
+
+use crate::error::IntoPyResult;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use redis_cloud::CloudClient;
+use redis_enterprise::{EnterpriseClient, EnvConfig};
+use std::env;
+use std::sync::{Arc, Mutex};
+
+/// Credentials for `CloudClient.from_env()`
+#[derive(PartialEq, Eq)]
+struct CloudEnv {
+    api_key: String,
+    api_secret: String,
+    base_url: Option<String>,
+}
+
+impl CloudEnv {
+    /// Read the Redis Cloud credentials from the environment
+    ///
+    /// Reads (tries each in order):
+    /// - API Key: REDIS_CLOUD_API_KEY, REDIS_CLOUD_ACCOUNT_KEY
+    /// - API Secret: REDIS_CLOUD_API_SECRET, REDIS_CLOUD_SECRET_KEY, REDIS_CLOUD_USER_KEY
+    /// - Base URL: REDIS_CLOUD_BASE_URL, REDIS_CLOUD_API_URL (optional)
+    fn from_env() -> PyResult<Self> {
+        // Try multiple env var names for API key (account key)
+        let api_key = env::var("REDIS_CLOUD_API_KEY")
+            .or_else(|_| env::var("REDIS_CLOUD_ACCOUNT_KEY"))
+            .map_err(|_| {
+                PyValueError::new_err(
+                    "API key not found. Set REDIS_CLOUD_API_KEY or REDIS_CLOUD_ACCOUNT_KEY",
+                )
+            })?;
+
+        // Try multiple env var names for API secret (user key)
+        let api_secret = env::var("REDIS_CLOUD_API_SECRET")
+            .or_else(|_| env::var("REDIS_CLOUD_SECRET_KEY"))
+            .or_else(|_| env::var("REDIS_CLOUD_USER_KEY"))
+            .map_err(|_| {
+                PyValueError::new_err(
+                    "API secret not found. Set REDIS_CLOUD_API_SECRET, REDIS_CLOUD_SECRET_KEY, or REDIS_CLOUD_USER_KEY",
+                )
+            })?;
+
+        // Try multiple env var names for base URL
+        let base_url = env::var("REDIS_CLOUD_BASE_URL")
+            .or_else(|_| env::var("REDIS_CLOUD_API_URL"))
+            .ok();
+
+        Ok(Self {
+            api_key,
+            api_secret,
+            base_url,
+        })
+    }
+}
+
+/// A client together with the settings it was built from
+type Cached<K, C> = Mutex<Option<(K, Arc<C>)>>;
+
+static CLOUD_CLIENT: Cached<CloudEnv, CloudClient> = Mutex::new(None);
+static ENTERPRISE_CLIENT: Cached<EnvConfig, EnterpriseClient> = Mutex::new(None);
+
+/// Get the client cached for `key`, or build and cache a new one
+///
+/// A cached client built from different settings is replaced. Errors from
+/// `build` are returned as-is and leave the cache unchanged.
+fn get_or_try_build<K, C, F>(cache: &Cached<K, C>, key: K, build: F) -> PyResult<Arc<C>>
+where
+    K: PartialEq,
+    F: FnOnce(&K) -> PyResult<C>,
+{
+    let mut guard = cache.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some((cached_key, client)) = guard.as_ref()
+        && *cached_key == key
+    {
+        return Ok(client.clone());
+    }
+
+    let client = Arc::new(build(&key)?);
+    *guard = Some((key, client.clone()));
+    Ok(client)
+}
+
+/// Get a Redis Cloud client for the current environment
+pub fn cloud_client() -> PyResult<Arc<CloudClient>> {
+    get_or_try_build(&CLOUD_CLIENT, CloudEnv::from_env()?, |env| {
+        let mut builder = CloudClient::builder()
+            .api_key(env.api_key.as_str())
+            .api_secret(env.api_secret.as_str());
+
+        if let Some(base_url) = &env.base_url {
+            builder = builder.base_url(base_url.as_str());
+        }
+
+        builder.build().into_py_result()
+    })
+}
+
+/// Get a Redis Enterprise client for the current environment
+pub fn enterprise_client() -> PyResult<Arc<EnterpriseClient>> {
+    let config = EnvConfig::from_env().into_py_result()?;
+    get_or_try_build(&ENTERPRISE_CLIENT, config, |config| {
+        config.builder().build().into_py_result()
+    })
+}
+
+/// Drop the clients cached by `from_env`
+///
+/// The next `CloudClient.from_env()` / `EnterpriseClient.from_env()` call
+/// builds a new client.
+#[pyfunction]
+#[pyo3(name = "_reset_env_cache")]
+pub fn reset_env_cache() {
+    *CLOUD_CLIENT.lock().unwrap_or_else(|e| e.into_inner()) = None;
+    *ENTERPRISE_CLIENT.lock().unwrap_or_else(|e| e.into_inner()) = None;
+}
@@ -30,8 +30,10 @@ use pyo3::prelude::*;
 
 mod cloud;
 mod enterprise;
+mod env;
 mod error;
 mod runtime;
+mod stats;
 
 use cloud::PyCloudClient;
 use enterprise::PyEnterpriseClient;
@@ -49,6 +51,9 @@ fn redisctl(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Register Enterprise client
     m.add_class::<PyEnterpriseClient>()?;
 
+    // Register env cache reset hook (used by tests)
+    m.add_function(wrap_pyfunction!(env::reset_env_cache, m)?)?;
+
     // Add version info
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
 
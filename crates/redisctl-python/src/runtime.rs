@@ -8,20 +8,28 @@ use std::sync::OnceLock;
 use tokio::runtime::Runtime;
 
 /// Global Tokio runtime instance
-static RUNTIME: OnceLock<Runtime> = OnceLock::new();
+static RUNTIME: OnceLock<&'static Runtime> = OnceLock::new();
 
 /// Get or initialize the global Tokio runtime
 ///
 /// This creates a multi-threaded runtime suitable for I/O-bound operations.
 /// The runtime is lazily initialized on first use and persists for the
-/// lifetime of the Python process.
+/// lifetime of the Python process. The same runtime is registered with
+/// `pyo3-async-runtimes`, so sync and async methods of every client share
+/// one set of worker threads instead of each starting its own runtime.
 pub fn get_runtime() -> &'static Runtime {
     RUNTIME.get_or_init(|| {
-        tokio::runtime::Builder::new_multi_thread()
-            .enable_all()
-            .thread_name("redisctl-tokio")
-            .build()
-            .expect("Failed to create Tokio runtime")
+        let runtime: &'static Runtime = Box::leak(Box::new(
+            tokio::runtime::Builder::new_multi_thread()
+                .enable_all()
+                .thread_name("redisctl-tokio")
+                .build()
+                .expect("Failed to create Tokio runtime"),
+        ));
+        // Register before publishing, so no caller can reach
+        // pyo3-async-runtimes before it knows about the shared runtime
+        let _ = pyo3_async_runtimes::tokio::init_with_runtime(runtime);
+        runtime
     })
 }
 
@@ -29,7 +37,10 @@ pub fn get_runtime() -> &'static Runtime {
 ///
 /// This is used for sync API variants that need to block until completion.
 /// It properly releases the GIL during the blocking call to allow other
-/// Python threads to run.
+/// Python threads to run, so sync calls from multiple Python threads proceed
+/// concurrently. Keep as much work as possible inside `future` (e.g.
+/// serializing responses to `serde_json::Value`); only the final conversion
+/// to Python objects needs the GIL.
 pub fn block_on<F, T>(py: Python<'_>, future: F) -> T
 where
     F: std::future::Future<Output = T> + Send,
@@ -47,5 +58,7 @@ pub fn future_into_py<'py, F>(py: Python<'py>, future: F) -> PyResult<Bound<'py,
 where
     F: std::future::Future<Output = PyResult<Py<PyAny>>> + Send + 'static,
 {
+    // Make sure pyo3-async-runtimes uses the shared runtime
+    get_runtime();
     pyo3_async_runtimes::tokio::future_into_py(py, future)
 }
@@ -0,0 +1,206 @@
+//! Column-oriented conversion of Redis Enterprise stats for NumPy
+//!
+//! Enterprise stats endpoints return a list of intervals, each an object of
+//! metric name to value. Converting that to Python produces one dict per
+//! interval and one Python object per sample. Here the samples are instead
+//! collected into one contiguous `Vec<f64>` per metric, which is handed to
+//! NumPy without copying.
+
+use numpy::PyArray1;
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
+use serde_json::Value;
+use std::collections::BTreeMap;
+
+/// Fields holding text rather than samples; every other metric is numeric
+const TEXT_FIELDS: &[&str] = &["stime", "etime", "interval"];
+
+/// A single stats column
+pub enum Column {
+    /// Numeric samples; missing samples are NaN
+    Numbers(Vec<f64>),
+    /// Text samples such as `stime` / `etime`
+    Strings(Vec<Option<String>>),
+}
+
+/// Stats samples grouped by metric name
+pub struct StatsColumns {
+    columns: BTreeMap<String, Column>,
+}
+
+impl StatsColumns {
+    /// Build columns from a stats response
+    ///
+    /// Uses the `intervals` array if present, otherwise treats the response
+    /// itself as a single interval. `stime`, `etime` and `interval` become
+    /// text columns; all other metrics are numeric, with numeric strings
+    /// parsed and anything else stored as NaN. Metrics absent from an
+    /// interval are filled with NaN (numeric) or None (text).
+    pub fn from_value(value: &Value) -> Self {
+        let intervals: Vec<&Value> = match value.get("intervals") {
+            Some(Value::Array(intervals)) => intervals.iter().collect(),
+            _ => vec![value],
+        };
+
+        let mut columns = BTreeMap::new();
+        for (row, interval) in intervals.iter().enumerate() {
+            let metrics = interval.as_object().into_iter().flatten();
+            for (name, sample) in metrics {
+                let column = columns.entry(name.clone()).or_insert_with(|| {
+                    if TEXT_FIELDS.contains(&name.as_str()) {
+                        Column::Strings(vec![None; row])
+                    } else {
+                        Column::Numbers(vec![f64::NAN; row])
+                    }
+                });
+                match column {
+                    Column::Numbers(v) => v.push(match sample {
+                        Value::Number(n) => n.as_f64().unwrap_or(f64::NAN),
+                        Value::String(s) => s.parse().unwrap_or(f64::NAN),
+                        _ => f64::NAN,
+                    }),
+                    Column::Strings(v) => v.push(match sample {
+                        Value::String(s) => Some(s.clone()),
+                        Value::Null => None,
+                        other => Some(other.to_string()),
+                    }),
+                }
+            }
+            // Pad columns this interval did not mention
+            for column in columns.values_mut() {
+                match column {
+                    Column::Numbers(v) => v.resize(row + 1, f64::NAN),
+                    Column::Strings(v) => v.resize(row + 1, None),
+                }
+            }
+        }
+
+        Self { columns }
+    }
+
+    /// Convert to a dict of metric name to `numpy.ndarray` (float64)
+    ///
+    /// Text columns are returned as lists of `str | None`.
+    pub fn into_py(self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let dict = PyDict::new(py);
+        for (name, column) in self.columns {
+            match column {
+                Column::Numbers(v) => dict.set_item(name, PyArray1::from_vec(py, v))?,
+                Column::Strings(v) => dict.set_item(name, PyList::new(py, v)?)?,
+            }
+        }
+        Ok(dict.into_any().unbind())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::json;
+
+    fn numbers<'a>(columns: &'a StatsColumns, name: &str) -> &'a [f64] {
+        match columns.columns.get(name) {
+            Some(Column::Numbers(v)) => v,
+            _ => panic!("{name} is not a numeric column"),
+        }
+    }
+
+    fn strings<'a>(columns: &'a StatsColumns, name: &str) -> &'a [Option<String>] {
+        match columns.columns.get(name) {
+            Some(Column::Strings(v)) => v,
+            _ => panic!("{name} is not a text column"),
+        }
+    }
+
+    #[test]
+    fn test_disjoint_metrics_are_padded() {
+        let columns = StatsColumns::from_value(&json!({
+            "intervals": [
+                {"cpu": 1.5},
+                {"mem": 3},
+                {"cpu": 2.0, "mem": 4}
+            ]
+        }));
+
+        let cpu = numbers(&columns, "cpu");
+        assert_eq!(cpu.len(), 3);
+        assert_eq!(cpu[0], 1.5);
+        assert!(cpu[1].is_nan());
+        assert_eq!(cpu[2], 2.0);
+
+        let mem = numbers(&columns, "mem");
+        assert_eq!(mem.len(), 3);
+        assert!(mem[0].is_nan());
+        assert_eq!(mem[1], 3.0);
+        assert_eq!(mem[2], 4.0);
+    }
+
+    #[test]
+    fn test_string_metric_is_text_column() {
+        let columns = StatsColumns::from_value(&json!({
+            "intervals": [
+                {"stime": "2026-01-01T00:00:00Z", "cpu": 1},
+                {"cpu": 2},
+                {"stime": "2026-01-01T00:10:00Z", "cpu": 3}
+            ]
+        }));
+
+        assert_eq!(
+            strings(&columns, "stime"),
+            [
+                Some("2026-01-01T00:00:00Z".to_string()),
+                None,
+                Some("2026-01-01T00:10:00Z".to_string()),
+            ]
+        );
+        assert_eq!(numbers(&columns, "cpu"), [1.0, 2.0, 3.0]);
+    }
+
+    #[test]
+    fn test_numeric_string_in_numeric_column_is_parsed() {
+        let columns = StatsColumns::from_value(&json!({
+            "intervals": [
+                {"cpu": 1},
+                {"cpu": "2.5"},
+                {"cpu": "n/a"}
+            ]
+        }));
+
+        let cpu = numbers(&columns, "cpu");
+        assert_eq!(cpu[0], 1.0);
+        assert_eq!(cpu[1], 2.5);
+        assert!(cpu[2].is_nan());
+    }
+
+    #[test]
+    fn test_numeric_string_first_sample_is_numeric_column() {
+        let columns = StatsColumns::from_value(&json!({
+            "intervals": [
+                {"cpu": "1.5", "etime": "2026-01-01T00:05:00Z"},
+                {"cpu": 2, "etime": null}
+            ]
+        }));
+
+        assert_eq!(numbers(&columns, "cpu"), [1.5, 2.0]);
+        assert_eq!(
+            strings(&columns, "etime"),
+            [Some("2026-01-01T00:05:00Z".to_string()), None]
+        );
+    }
+
+    #[test]
+    fn test_response_without_intervals_is_single_row() {
+        let columns = StatsColumns::from_value(&json!({
+            "uid": 1,
+            "cpu_user": 0.5,
+            "stime": "2026-01-01T00:00:00Z"
+        }));
+
+        assert_eq!(numbers(&columns, "uid"), [1.0]);
+        assert_eq!(numbers(&columns, "cpu_user"), [0.5]);
+        assert_eq!(
+            strings(&columns, "stime"),
+            [Some("2026-01-01T00:00:00Z".to_string())]
+        );
+    }
+}
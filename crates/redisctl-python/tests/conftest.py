@@ -0,0 +1,69 @@
+"""Shared fixtures for redisctl Python binding tests."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def rc():
+    """The redisctl package, imported once per test session."""
+    import redisctl
+
+    return redisctl
+
+
+@pytest.fixture(autouse=True)
+def reset_env_cache(rc):
+    """Clear cached from_env credentials so each test sees its own environment."""
+    rc._reset_env_cache()
+    yield
+    rc._reset_env_cache()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Serve `GET /items/<n>` as `{"item": n}`, delayed so later items finish first.
+
+    `GET /malformed` returns a 200 response whose body is not valid JSON.
+    """
+
+    def do_GET(self):
+        if self.path == "/malformed":
+            body = b'{"item": '
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        prefix = "/items/"
+        if not self.path.startswith(prefix) or not self.path[len(prefix) :].isdigit():
+            self.send_error(404)
+            return
+
+        item = int(self.path[len(prefix) :])
+        time.sleep(max(0, 5 - item) * 0.02)
+        body = json.dumps({"item": item}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    """Base URL of a local HTTP server serving canned API responses."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
@@ -4,7 +4,10 @@ These tests verify the basic functionality of the Python bindings without
 requiring actual Redis Cloud or Enterprise instances.
 """
 
+import inspect
 import os
+import subprocess
+import sys
 
 import pytest
 
@@ -12,47 +15,81 @@ import pytest
 class TestModuleImports:
     """Test that the module imports correctly."""
 
-    def test_import_module(self):
+    def test_import_module(self, rc):
         """Test that we can import the redisctl module."""
-        import redisctl
+        assert rc is not None
 
-        assert redisctl is not None
-
-    def test_version(self):
+    def test_version(self, rc):
         """Test that version is available."""
-        import redisctl
-
-        assert hasattr(redisctl, "__version__")
-        assert isinstance(redisctl.__version__, str)
-        assert len(redisctl.__version__) > 0
+        assert hasattr(rc, "__version__")
+        assert isinstance(rc.__version__, str)
+        assert len(rc.__version__) > 0
 
-    def test_classes_available(self):
+    def test_classes_available(self, rc):
         """Test that main classes are available."""
-        from redisctl import CloudClient, EnterpriseClient, RedisCtlError
+        assert rc.CloudClient is not None
+        assert rc.EnterpriseClient is not None
+        assert rc.RedisCtlError is not None
+
+    def test_import_is_lazy(self):
+        """Test that importing the package does not load the native extension."""
+        code = "import sys, redisctl; assert 'redisctl.redisctl' not in sys.modules"
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_native_submodule_after_lazy_load(self):
+        """Test that redisctl.redisctl is importable after the lazy load."""
+        code = (
+            "import redisctl; redisctl.CloudClient; "
+            "import redisctl.redisctl; "
+            "assert redisctl.redisctl.CloudClient is redisctl.CloudClient"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_native_submodule_is_lazy_attribute(self):
+        """Test that redisctl.redisctl loads the native extension on access."""
+        code = (
+            "import redisctl; "
+            "assert redisctl.redisctl.CloudClient is redisctl.CloudClient"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_concurrent_first_access(self):
+        """Test that threads racing on the first access share one native module."""
+        code = (
+            "import sys, threading, redisctl\n"
+            "seen = []\n"
+            "def load():\n"
+            "    seen.append(redisctl.CloudClient)\n"
+            "threads = [threading.Thread(target=load) for _ in range(8)]\n"
+            "for t in threads: t.start()\n"
+            "for t in threads: t.join()\n"
+            "assert len(set(map(id, seen))) == 1\n"
+            "assert sys.modules['redisctl.redisctl'].CloudClient is seen[0]\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
 
-        assert CloudClient is not None
-        assert EnterpriseClient is not None
-        assert RedisCtlError is not None
+    def test_dir_lists_exports(self, rc):
+        """Test that lazily loaded names are listed by dir()."""
+        names = dir(rc)
+        for name in (*rc.__all__, "_reset_env_cache", "__name__", "__doc__"):
+            assert name in names
+        assert "sys" not in names
 
 
 class TestCloudClient:
     """Tests for CloudClient."""
 
-    def test_constructor(self):
+    def test_constructor(self, rc):
         """Test that we can create a CloudClient."""
-        from redisctl import CloudClient
-
-        client = CloudClient(
+        client = rc.CloudClient(
             api_key="test-key",
             api_secret="test-secret",
         )
         assert client is not None
 
-    def test_constructor_with_options(self):
+    def test_constructor_with_options(self, rc):
         """Test CloudClient with all options."""
-        from redisctl import CloudClient
-
-        client = CloudClient(
+        client = rc.CloudClient(
             api_key="test-key",
             api_secret="test-secret",
             base_url="https://api.example.com/v1",
@@ -60,10 +97,8 @@ class TestCloudClient:
         )
         assert client is not None
 
-    def test_from_env_missing_vars(self):
+    def test_from_env_missing_vars(self, rc):
         """Test that from_env raises when env vars are missing."""
-        from redisctl import CloudClient
-
         # Clear any existing env vars
         for var in [
             "REDIS_CLOUD_API_KEY",
@@ -75,12 +110,10 @@ class TestCloudClient:
             os.environ.pop(var, None)
 
         with pytest.raises(ValueError, match="API key not found"):
-            CloudClient.from_env()
+            rc.CloudClient.from_env()
 
-    def test_from_env_missing_secret(self):
+    def test_from_env_missing_secret(self, rc):
         """Test that from_env raises when secret is missing."""
-        from redisctl import CloudClient
-
         # Clear any existing env vars
         for var in [
             "REDIS_CLOUD_API_SECRET",
@@ -93,88 +126,141 @@ class TestCloudClient:
 
         try:
             with pytest.raises(ValueError, match="API secret not found"):
-                CloudClient.from_env()
+                rc.CloudClient.from_env()
         finally:
             os.environ.pop("REDIS_CLOUD_API_KEY", None)
 
-    def test_from_env_success(self):
+    def test_from_env_success(self, rc):
         """Test that from_env works with valid env vars."""
-        from redisctl import CloudClient
-
         os.environ["REDIS_CLOUD_API_KEY"] = "test-key"
         os.environ["REDIS_CLOUD_API_SECRET"] = "test-secret"
 
         try:
-            client = CloudClient.from_env()
+            client = rc.CloudClient.from_env()
             assert client is not None
         finally:
             os.environ.pop("REDIS_CLOUD_API_KEY", None)
             os.environ.pop("REDIS_CLOUD_API_SECRET", None)
 
-    def test_from_env_alternate_vars(self):
+    def test_from_env_alternate_vars(self, rc):
         """Test that from_env works with alternate env var names."""
-        from redisctl import CloudClient
-
         os.environ["REDIS_CLOUD_ACCOUNT_KEY"] = "test-key"
         os.environ["REDIS_CLOUD_USER_KEY"] = "test-secret"
 
         try:
-            client = CloudClient.from_env()
+            client = rc.CloudClient.from_env()
             assert client is not None
         finally:
             os.environ.pop("REDIS_CLOUD_ACCOUNT_KEY", None)
             os.environ.pop("REDIS_CLOUD_USER_KEY", None)
 
-    def test_has_sync_methods(self):
-        """Test that sync methods exist."""
-        from redisctl import CloudClient
+    def test_from_env_follows_env_changes(self, rc):
+        """Test that from_env picks up changed or removed env vars."""
+        os.environ["REDIS_CLOUD_API_KEY"] = "test-key"
+        os.environ["REDIS_CLOUD_API_SECRET"] = "test-secret"
 
-        client = CloudClient(api_key="test", api_secret="test")
+        try:
+            assert rc.CloudClient.from_env() is not None
+            os.environ["REDIS_CLOUD_API_KEY"] = "other-key"
+            assert rc.CloudClient.from_env() is not None
+        finally:
+            os.environ.pop("REDIS_CLOUD_API_KEY", None)
+            os.environ.pop("REDIS_CLOUD_API_SECRET", None)
 
-        assert hasattr(client, "subscriptions_sync")
-        assert hasattr(client, "subscription_sync")
-        assert hasattr(client, "databases_sync")
-        assert hasattr(client, "database_sync")
-        assert hasattr(client, "get_sync")
-        assert hasattr(client, "post_sync")
-        assert hasattr(client, "put_sync")
-        assert hasattr(client, "delete_sync")
+        # A previously built client is not reused once the env vars are gone
+        with pytest.raises(ValueError, match="API key not found"):
+            rc.CloudClient.from_env()
 
-    def test_has_async_methods(self):
+    def test_has_sync_methods(self, rc):
+        """Test that sync methods exist."""
+        client = rc.CloudClient(api_key="test", api_secret="test")
+
+        methods = frozenset(dir(client))
+        assert {
+            "subscriptions_sync",
+            "subscription_sync",
+            "databases_sync",
+            "database_sync",
+            "get_sync",
+            "get_many_sync",
+            "post_sync",
+            "put_sync",
+            "delete_sync",
+        } <= methods
+        assert "raw" in inspect.signature(client.get_sync).parameters
+
+    def test_has_async_methods(self, rc):
         """Test that async methods exist."""
-        from redisctl import CloudClient
+        client = rc.CloudClient(api_key="test", api_secret="test")
+
+        methods = frozenset(dir(client))
+        assert {
+            "subscriptions",
+            "subscription",
+            "databases",
+            "database",
+            "get",
+            "get_many",
+            "post",
+            "put",
+            "delete",
+        } <= methods
+
+    def test_get_many_sync_empty(self, rc):
+        """Test that get_many_sync with no paths returns an empty list."""
+        client = rc.CloudClient(api_key="test", api_secret="test")
+
+        assert client.get_many_sync([]) == []
+
+    def test_get_many_sync_keeps_order(self, rc, stub_server):
+        """Test that get_many_sync returns results in the order of the paths."""
+        client = rc.CloudClient(
+            api_key="test",
+            api_secret="test",
+            base_url=stub_server,
+        )
+
+        results = client.get_many_sync([f"/items/{i}" for i in range(5)])
+        assert results == [{"item": i} for i in range(5)]
+
+    def test_get_many_sync_not_found(self, rc, stub_server):
+        """Test that a failing path makes get_many_sync raise."""
+        client = rc.CloudClient(
+            api_key="test",
+            api_secret="test",
+            base_url=stub_server,
+        )
+
+        with pytest.raises(ValueError, match="not found"):
+            client.get_many_sync(["/items/1", "/missing"])
 
-        client = CloudClient(api_key="test", api_secret="test")
+    def test_get_sync_malformed_response(self, rc, stub_server):
+        """Test that an unparseable response body raises ConnectionError."""
+        client = rc.CloudClient(
+            api_key="test",
+            api_secret="test",
+            base_url=stub_server,
+        )
 
-        assert hasattr(client, "subscriptions")
-        assert hasattr(client, "subscription")
-        assert hasattr(client, "databases")
-        assert hasattr(client, "database")
-        assert hasattr(client, "get")
-        assert hasattr(client, "post")
-        assert hasattr(client, "put")
-        assert hasattr(client, "delete")
+        with pytest.raises(ConnectionError, match="Failed to deserialize"):
+            client.get_sync("/malformed")
 
 
 class TestEnterpriseClient:
     """Tests for EnterpriseClient."""
 
-    def test_constructor(self):
+    def test_constructor(self, rc):
         """Test that we can create an EnterpriseClient."""
-        from redisctl import EnterpriseClient
-
-        client = EnterpriseClient(
+        client = rc.EnterpriseClient(
             base_url="https://cluster:9443",
             username="admin@example.com",
             password="password",
         )
         assert client is not None
 
-    def test_constructor_with_options(self):
+    def test_constructor_with_options(self, rc):
         """Test EnterpriseClient with all options."""
-        from redisctl import EnterpriseClient
-
-        client = EnterpriseClient(
+        client = rc.EnterpriseClient(
             base_url="https://cluster:9443",
             username="admin@example.com",
             password="password",
@@ -183,10 +269,8 @@ class TestEnterpriseClient:
         )
         assert client is not None
 
-    def test_from_env_missing_vars(self):
+    def test_from_env_missing_vars(self, rc):
         """Test that from_env raises when env vars are missing."""
-        from redisctl import EnterpriseClient
-
         # Clear any existing env vars
         for var in [
             "REDIS_ENTERPRISE_URL",
@@ -196,90 +280,134 @@ class TestEnterpriseClient:
             os.environ.pop(var, None)
 
         with pytest.raises(Exception):
-            EnterpriseClient.from_env()
+            rc.EnterpriseClient.from_env()
 
-    def test_from_env_success(self):
+    def test_from_env_success(self, rc):
         """Test that from_env works with valid env vars."""
-        from redisctl import EnterpriseClient
-
         os.environ["REDIS_ENTERPRISE_URL"] = "https://cluster:9443"
         os.environ["REDIS_ENTERPRISE_USER"] = "admin@example.com"
         os.environ["REDIS_ENTERPRISE_PASSWORD"] = "password"
 
         try:
-            client = EnterpriseClient.from_env()
+            client = rc.EnterpriseClient.from_env()
             assert client is not None
         finally:
             os.environ.pop("REDIS_ENTERPRISE_URL", None)
             os.environ.pop("REDIS_ENTERPRISE_USER", None)
             os.environ.pop("REDIS_ENTERPRISE_PASSWORD", None)
 
-    def test_has_sync_methods(self):
+    def test_has_sync_methods(self, rc):
         """Test that sync methods exist."""
-        from redisctl import EnterpriseClient
+        client = rc.EnterpriseClient(
+            base_url="https://cluster:9443",
+            username="admin",
+            password="pass",
+        )
 
-        client = EnterpriseClient(
+        methods = frozenset(dir(client))
+        assert {
+            # Cluster methods
+            "cluster_info_sync",
+            "cluster_stats_sync",
+            "cluster_stats_ndarray_sync",
+            "license_sync",
+            # Database methods
+            "databases_sync",
+            "database_sync",
+            "database_stats_sync",
+            "database_stats_ndarray_sync",
+            # Node methods
+            "nodes_sync",
+            "node_sync",
+            "node_stats_sync",
+            "node_stats_ndarray_sync",
+            # User methods
+            "users_sync",
+            "user_sync",
+            # Raw API methods
+            "get_sync",
+            "get_many_sync",
+            "post_sync",
+            "put_sync",
+            "delete_sync",
+        } <= methods
+        assert "raw" in inspect.signature(client.get_sync).parameters
+
+    def test_has_async_methods(self, rc):
+        """Test that async methods exist."""
+        client = rc.EnterpriseClient(
             base_url="https://cluster:9443",
             username="admin",
             password="pass",
         )
 
-        # Cluster methods
-        assert hasattr(client, "cluster_info_sync")
-        assert hasattr(client, "cluster_stats_sync")
-        assert hasattr(client, "license_sync")
+        methods = frozenset(dir(client))
+        assert {
+            # Cluster methods
+            "cluster_info",
+            "cluster_stats",
+            "cluster_stats_ndarray",
+            "license",
+            # Database methods
+            "databases",
+            "database",
+            "database_stats",
+            "database_stats_ndarray",
+            # Node methods
+            "nodes",
+            "node",
+            "node_stats",
+            "node_stats_ndarray",
+            # User methods
+            "users",
+            "user",
+            # Raw API methods
+            "get",
+            "get_many",
+            "post",
+            "put",
+            "delete",
+        } <= methods
+
+    def test_get_many_sync_empty(self, rc):
+        """Test that get_many_sync with no paths returns an empty list."""
+        client = rc.EnterpriseClient(
+            base_url="https://cluster:9443",
+            username="admin",
+            password="pass",
+        )
 
-        # Database methods
-        assert hasattr(client, "databases_sync")
-        assert hasattr(client, "database_sync")
-        assert hasattr(client, "database_stats_sync")
+        assert client.get_many_sync([]) == []
 
-        # Node methods
-        assert hasattr(client, "nodes_sync")
-        assert hasattr(client, "node_sync")
-        assert hasattr(client, "node_stats_sync")
+    def test_get_many_sync_keeps_order(self, rc, stub_server):
+        """Test that get_many_sync returns results in the order of the paths."""
+        client = rc.EnterpriseClient(
+            base_url=stub_server,
+            username="admin",
+            password="pass",
+        )
 
-        # User methods
-        assert hasattr(client, "users_sync")
-        assert hasattr(client, "user_sync")
+        results = client.get_many_sync([f"/items/{i}" for i in range(5)])
+        assert results == [{"item": i} for i in range(5)]
 
-        # Raw API methods
-        assert hasattr(client, "get_sync")
-        assert hasattr(client, "post_sync")
-        assert hasattr(client, "put_sync")
-        assert hasattr(client, "delete_sync")
+    def test_get_many_sync_not_found(self, rc, stub_server):
+        """Test that a failing path makes get_many_sync raise."""
+        client = rc.EnterpriseClient(
+            base_url=stub_server,
+            username="admin",
+            password="pass",
+        )
 
-    def test_has_async_methods(self):
-        """Test that async methods exist."""
-        from redisctl import EnterpriseClient
+        with pytest.raises(ValueError, match="not found"):
+            client.get_many_sync(["/items/1", "/missing"])
 
-        client = EnterpriseClient(
-            base_url="https://cluster:9443",
+    def test_get_sync_malformed_response(self, rc, stub_server):
+        """Test that an unparseable response body raises RuntimeError."""
+        client = rc.EnterpriseClient(
+            base_url=stub_server,
             username="admin",
             password="pass",
         )
 
-        # Cluster methods
-        assert hasattr(client, "cluster_info")
-        assert hasattr(client, "cluster_stats")
-        assert hasattr(client, "license")
-
-        # Database methods
-        assert hasattr(client, "databases")
-        assert hasattr(client, "database")
-        assert hasattr(client, "database_stats")
-
-        # Node methods
-        assert hasattr(client, "nodes")
-        assert hasattr(client, "node")
-        assert hasattr(client, "node_stats")
-
-        # User methods
-        assert hasattr(client, "users")
-        assert hasattr(client, "user")
-
-        # Raw API methods
-        assert hasattr(client, "get")
-        assert hasattr(client, "post")
-        assert hasattr(client, "put")
-        assert hasattr(client, "delete")
+        with pytest.raises(RuntimeError, match="Failed to deserialize"):
+            client.get_sync("/malformed")